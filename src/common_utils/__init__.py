@@ -15,13 +15,16 @@ from .json_utils import (
     save_json,
     parse_json,
     to_json,
+    validate_json_schema,
+    merge_json,
     ensure_json_dir
 )
 
 from .logging_utils import (
     setup_logger,
     get_logger,
-    set_log_level
+    set_log_level,
+    log_performance
 )
 
 from .config_utils import (
@@ -33,6 +36,7 @@ from .config_utils import (
 
 from .file_utils import (
     ensure_dir,
+    iter_files,
     list_files,
     copy_file,
     move_file,
@@ -58,12 +62,15 @@ __all__ = [
     'save_json',
     'parse_json',
     'to_json',
+    'validate_json_schema',
+    'merge_json',
     'ensure_json_dir',
     
     # Logging
     'setup_logger',
     'get_logger',
     'set_log_level',
+    'log_performance',
     
     # Config
     'Config',
@@ -73,6 +80,7 @@ __all__ = [
     
     # File
     'ensure_dir',
+    'iter_files',
     'list_files',
     'copy_file',
     'move_file',
@@ -3,18 +3,58 @@ Configuration utilities for all Python services.
 """
 
 import os
+import logging
+import weakref
 from pathlib import Path
 from typing import Any, Dict, Optional
 from .json_utils import load_json, save_json
 
+logger = logging.getLogger(__name__)
+
+def _flush_pending(state: Dict[str, Any]) -> None:
+    """Write back unsaved changes of a Config that was never flushed.
+
+    Runs from a finalizer, where a raised exception would only be printed
+    and ignored, so failures are logged instead.
+    """
+    if not state["_dirty"]:
+        return
+    try:
+        save_json(state["config"], state["config_path"])
+        state["_dirty"] = False
+    except Exception:
+        logger.exception("Failed to save unflushed config %s", state["config_path"])
+
 class Config:
-    """Configuration manager."""
+    """Configuration manager.
+
+    Mutations only mark the configuration dirty; it is written back by
+    ``flush()``, when a ``with Config(path) as config:`` block exits
+    without an exception, or when the instance is garbage collected or the
+    interpreter exits. Errors from the last two are only logged, so call
+    ``flush()`` to see them. A ``with`` block that raises discards its
+    unsaved changes by reloading the file.
+    """
     
     def __init__(self, config_path: str):
         """Initialize with config file path."""
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
+        self._dirty = False
         self.load()
+        # The finalizer holds the instance dict, not the instance, so it
+        # does not keep the Config alive
+        weakref.finalize(self, _flush_pending, self.__dict__)
+
+    def __enter__(self) -> "Config":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+        elif self._dirty:
+            # Don't let the finalizer write a half-applied batch later
+            self.load()
 
     def load(self) -> None:
         """Load configuration from file."""
@@ -22,10 +62,17 @@ class Config:
             self.config = load_json(self.config_path)
         else:
             self.config = {}
+        self._dirty = False
 
     def save(self) -> None:
         """Save configuration to file."""
         save_json(self.config, self.config_path)
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Save configuration to file if it has unsaved changes."""
+        if self._dirty:
+            self.save()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
@@ -34,18 +81,18 @@ class Config:
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
         self.config[key] = value
-        self.save()
+        self._dirty = True
 
     def update(self, config_dict: Dict[str, Any]) -> None:
         """Update multiple configuration values."""
         self.config.update(config_dict)
-        self.save()
+        self._dirty = True
 
     def delete(self, key: str) -> None:
         """Delete configuration value."""
         if key in self.config:
             del self.config[key]
-            self.save()
+            self._dirty = True
 
 def get_env_var(key: str, default: Optional[str] = None) -> str:
     """Get environment variable with default value."""
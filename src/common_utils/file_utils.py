@@ -4,16 +4,49 @@ File utilities for all Python services.
 
 import os
 import shutil
+import fnmatch
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 def ensure_dir(dir_path: str) -> None:
     """Ensure directory exists."""
     Path(dir_path).mkdir(parents=True, exist_ok=True)
 
-def list_files(dir_path: str, pattern: str = "*") -> List[str]:
+def _scan_files(dir_path: str, pattern: str, recursive: bool) -> Iterator[str]:
+    """Yield files whose names match pattern using os.scandir.
+
+    DirEntry caches the file type from readdir, so no extra stat call is
+    made per regular file. Symlinks to files are listed like glob does,
+    but symlinked directories are not descended into. Missing, unreadable
+    or non-directory paths yield nothing, as with glob.
+    """
+    try:
+        entries = os.scandir(dir_path)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_file():
+                if pattern == "*" or fnmatch.fnmatch(entry.name, pattern):
+                    yield entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, pattern, recursive)
+
+def iter_files(dir_path: str, pattern: str = "*", recursive: bool = False) -> Iterator[str]:
+    """Iterate over files in directory matching pattern."""
+    # Name-only patterns are matched on scandir entries; anything with a
+    # path component still goes through glob
+    if "/" not in pattern and os.sep not in pattern and "**" not in pattern:
+        yield from _scan_files(dir_path, pattern, recursive)
+        return
+    paths = Path(dir_path).rglob(pattern) if recursive else Path(dir_path).glob(pattern)
+    for p in paths:
+        if p.is_file():
+            yield str(p)
+
+def list_files(dir_path: str, pattern: str = "*", recursive: bool = False) -> List[str]:
     """List files in directory matching pattern."""
-    return [str(p) for p in Path(dir_path).glob(pattern)]
+    return list(iter_files(dir_path, pattern, recursive))
 
 def copy_file(src: str, dst: str) -> None:
     """Copy file from src to dst."""
@@ -27,15 +60,50 @@ def delete_file(file_path: str) -> None:
     """Delete file."""
     Path(file_path).unlink(missing_ok=True)
 
+# Raw descriptors are opened in text mode on Windows unless O_BINARY is set
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+def _read_bytes(file_path: str) -> bytes:
+    """Read the whole file with a single unbuffered read."""
+    fd = os.open(file_path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if size and len(data) == size:
+            return data
+        # Short read, or a file that reports no size (pipes, procfs):
+        # keep reading until EOF
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
 def read_file(file_path: str, encoding: str = 'utf-8') -> str:
-    """Read file content."""
-    with open(file_path, 'r', encoding=encoding) as f:
-        return f.read()
+    """Read file content.
+
+    Line endings are normalized to ``\\n`` as in text mode.
+    """
+    text = _read_bytes(file_path).decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 def write_file(file_path: str, content: str, encoding: str = 'utf-8') -> None:
-    """Write content to file."""
-    with open(file_path, 'w', encoding=encoding) as f:
-        f.write(content)
+    """Write content to file.
+
+    Content is written as-is, without translating ``\\n`` on Windows.
+    """
+    data = memoryview(content.encode(encoding))
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 def append_file(file_path: str, content: str, encoding: str = 'utf-8') -> None:
     """Append content to file."""
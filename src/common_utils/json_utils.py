@@ -3,27 +3,130 @@ JSON utilities for all Python services.
 """
 
 import json
+import math
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+
+from .file_utils import _read_bytes
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains NaN or infinite floats."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+def _orjson_dumps(data: Any, option: int = 0) -> Optional[bytes]:
+    """Serialize with orjson, or return None where only stdlib json keeps the data.
+
+    orjson rejects integers beyond 64 bits and writes NaN/Infinity as null;
+    those cases are left to the stdlib json module.
+    """
+    try:
+        result = orjson.dumps(data, option=option | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+    # Non-finite floats can only hide behind a null
+    if b"null" in result and _has_non_finite(data):
+        return None
+    return result
+
+def _loads(data: Any) -> Any:
+    """Parse JSON with orjson, falling back to stdlib json for NaN/Infinity literals."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 def load_json(file_path: str) -> Dict[str, Any]:
     """Load JSON from file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return _loads(_read_bytes(file_path))
 
 def save_json(data: Dict[str, Any], file_path: str, indent: int = 2) -> None:
     """Save data to JSON file."""
+    # orjson only supports two-space indentation; other widths keep the
+    # stdlib output byte for byte
+    if orjson is not None and indent == 2:
+        result = _orjson_dumps(data, orjson.OPT_INDENT_2)
+        if result is not None:
+            Path(file_path).write_bytes(result)
+            return
     with open(file_path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 
 def parse_json(json_str: str) -> Dict[str, Any]:
     """Parse JSON string."""
-    return json.loads(json_str)
+    return _loads(json_str)
 
 def to_json(data: Any, indent: Optional[int] = None) -> str:
-    """Convert data to JSON string."""
+    """Convert data to JSON string.
+
+    Without indent the output is compact (no space after ``,`` or ``:``)
+    when orjson is installed.
+    """
+    if orjson is not None and indent in (None, 2):
+        result = _orjson_dumps(data, orjson.OPT_INDENT_2 if indent else 0)
+        if result is not None:
+            return result.decode('utf-8')
     return json.dumps(data, indent=indent, ensure_ascii=False)
 
+def _schema_key(schema: Dict[str, Any]) -> bytes:
+    """Canonical serialized form of a schema, used as the validator cache key."""
+    if orjson is not None:
+        return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(schema, sort_keys=True).encode('utf-8')
+
+@lru_cache(maxsize=128)
+def _compile_validator(schema_key: bytes) -> Any:
+    """Build and check a validator once per distinct schema."""
+    from jsonschema.validators import validator_for
+    schema = json.loads(schema_key)
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+def validate_json_schema(data: Any, schema: Dict[str, Any]) -> bool:
+    """Check whether data matches a JSON schema."""
+    return _compile_validator(_schema_key(schema)).is_valid(data)
+
+def merge_json(obj1: Dict[str, Any], obj2: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge obj2 into a copy of obj1.
+
+    Nested dicts are merged, lists are concatenated and any other value
+    from obj2 overrides the one in obj1. The inputs are not modified.
+    """
+    result = obj1.copy()
+    # Walk nested dicts with an explicit stack instead of recursion
+    stack = [(result, obj2)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = current.copy()
+                target[key] = merged
+                stack.append((merged, value))
+            elif isinstance(current, list) and isinstance(value, list):
+                target[key] = [*current, *value]
+            else:
+                target[key] = value
+    return result
+
 def ensure_json_dir(dir_path: str) -> None:
     """Ensure directory exists for JSON files."""
-    Path(dir_path).mkdir(parents=True, exist_ok=True) 
\ No newline at end of file
+    Path(dir_path).mkdir(parents=True, exist_ok=True)
@@ -2,10 +2,25 @@
 Logging utilities for all Python services.
 """
 
-import logging
 import sys
+import time
+import queue
+import atexit
+import logging
+import logging.handlers
+from functools import wraps
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+def _stop_listener(logger: logging.Logger) -> None:
+    """Flush and stop the background listener attached by setup_logger."""
+    listener = getattr(logger, '_listener', None)
+    if listener is None:
+        return
+    logger._listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
 
 def setup_logger(
     name: str,
@@ -13,17 +28,27 @@ def setup_logger(
     level: int = logging.INFO,
     format_str: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 ) -> logging.Logger:
-    """Setup logger with file and console handlers."""
+    """Setup logger with file and console handlers.
+
+    The handlers run on a background ``QueueListener`` thread; the logger
+    itself only enqueues records, so logging calls never block on I/O.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Drop the queue of a previous setup so records aren't emitted twice
+    _stop_listener(logger)
+    for handler in list(logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            logger.removeHandler(handler)
+
     # Create formatter
     formatter = logging.Formatter(format_str)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler if log_file is provided
     if log_file:
@@ -33,7 +58,22 @@ def setup_logger(
 
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    logger._listener = listener
+    # Levels are only applied before enqueueing; the listener's handlers
+    # stay at NOTSET so records already queued are never filtered again
+    logger._cached_handlers = (queue_handler,)
+    # One exit hook per logger; it stops whichever listener is current
+    if not getattr(logger, '_stop_registered', False):
+        atexit.register(_stop_listener, logger)
+        logger._stop_registered = True
 
     return logger
 
@@ -44,5 +84,22 @@ def get_logger(name: str) -> logging.Logger:
 def set_log_level(logger: logging.Logger, level: int) -> None:
     """Set log level for logger."""
     logger.setLevel(level)
-    for handler in logger.handlers:
-        handler.setLevel(level) 
\ No newline at end of file
+    for handler in getattr(logger, '_cached_handlers', logger.handlers):
+        handler.setLevel(level) 
+
+def log_performance(logger: logging.Logger, level: int = logging.INFO) -> Callable:
+    """Decorator that logs the execution time of the wrapped function."""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Skip timing entirely when the record would be dropped
+            if not logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed_us = (time.perf_counter_ns() - start) // 1000
+                logger.log(level, "%s execution time %d us", func.__qualname__, elapsed_us)
+        return wrapper
+    return decorator
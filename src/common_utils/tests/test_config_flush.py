@@ -0,0 +1,57 @@
+"""
+Tests for deferred configuration saving.
+"""
+
+import gc
+import pytest
+from ..config_utils import Config
+from ..json_utils import load_json
+
+def test_config_flush(tmp_path):
+    """Test that changes are written once on flush."""
+    config_file = tmp_path / "config.json"
+    
+    with Config(str(config_file)) as config:
+        config.set("a", 1)
+        config.update({"b": 2})
+        assert not config_file.exists()
+    
+    assert Config(str(config_file)).get("b") == 2
+
+def test_config_flush_on_collect(tmp_path):
+    """Test that an unflushed config is saved when it is collected."""
+    config_file = tmp_path / "config.json"
+    
+    config = Config(str(config_file))
+    config.set(5, "x")
+    del config
+    gc.collect()
+    
+    assert load_json(str(config_file)) == {"5": "x"}
+
+def test_config_flush_error(tmp_path):
+    """Test that an explicit flush raises save errors."""
+    config = Config(str(tmp_path / "missing" / "config.json"))
+    config.set("a", 1)
+    
+    with pytest.raises(FileNotFoundError):
+        config.flush()
+    
+    # Discard the change so the finalizer has nothing left to write
+    config.load()
+
+def test_config_exit_with_error(tmp_path):
+    """Test that a with block that raises does not write its changes."""
+    config_file = tmp_path / "config.json"
+    with Config(str(config_file)) as config:
+        config.set("a", 1)
+    
+    with pytest.raises(RuntimeError):
+        with Config(str(config_file)) as config:
+            config.set("a", 2)
+            raise RuntimeError("batch failed")
+    
+    assert config.get("a") == 1
+    del config
+    gc.collect()
+    assert load_json(str(config_file)) == {"a": 1}
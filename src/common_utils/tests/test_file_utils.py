@@ -7,6 +7,7 @@ import os
 import shutil
 from ..file_utils import (
     ensure_dir,
+    iter_files,
     list_files,
     read_file,
     write_file,
@@ -50,6 +51,22 @@ def test_list_files(tmp_path):
     
     all_files = list_files(str(tmp_path), recursive=True)
     assert len(all_files) == 4
+    
+    # Test lazy iteration
+    files_iter = iter_files(str(tmp_path), pattern="*.txt", recursive=True)
+    assert sorted(files_iter) == sorted(list_files(str(tmp_path), pattern="*.txt", recursive=True))
+    
+    # Test missing directory and file paths
+    assert list_files(str(tmp_path / "missing")) == []
+    assert list_files(str(tmp_path / "test1.txt")) == []
+
+def test_list_files_symlink(tmp_path):
+    """Test that symlinked files are listed."""
+    (tmp_path / "a.pt").write_text("a")
+    (tmp_path / "latest.pt").symlink_to(tmp_path / "a.pt")
+
+    files = list_files(str(tmp_path), pattern="*.pt")
+    assert sorted(files) == sorted([str(tmp_path / "a.pt"), str(tmp_path / "latest.pt")])
 
 def test_read_write_file(tmp_path):
     """Test file reading and writing."""
@@ -67,6 +84,12 @@ def test_read_write_file(tmp_path):
     with pytest.raises(FileNotFoundError):
         read_file("non_existent.txt")
 
+def test_read_file_newlines(tmp_path):
+    """Test that line endings are normalized on read."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_bytes(b"a\r\nb\rc\n")
+    assert read_file(str(test_file)) == "a\nb\nc\n"
+
 def test_copy_move_file(tmp_path):
     """Test file copying and moving."""
     source = tmp_path / "source.txt"
@@ -2,10 +2,13 @@
 Tests for JSON utilities.
 """
 
+import math
 import pytest
 from ..json_utils import (
     load_json,
     save_json,
+    parse_json,
+    to_json,
     validate_json_schema,
     merge_json
 )
@@ -79,4 +82,35 @@ def test_merge_json():
     # Test list merge
     obj1 = {"a": [1, 2]}
     obj2 = {"a": [3, 4]}
-    assert merge_json(obj1, obj2) == {"a": [1, 2, 3, 4]} 
\ No newline at end of file
+    assert merge_json(obj1, obj2) == {"a": [1, 2, 3, 4]} 
+
+def test_parse_to_json_roundtrip():
+    """Test converting data to a JSON string and back."""
+    data = {"name": "Тетрис", "scores": [1, 2, 3], "nested": {"ok": True}}
+    assert parse_json(to_json(data)) == data
+    assert parse_json(to_json(data, indent=4)) == data
+
+def test_to_json_non_str_keys():
+    """Test that non-string keys are written as strings."""
+    assert parse_json(to_json({1: "a"})) == {"1": "a"}
+    assert parse_json(to_json({1: "a"}, indent=2)) == {"1": "a"}
+
+def test_save_json_non_str_keys(tmp_path):
+    """Test saving a dict with non-string keys."""
+    json_file = tmp_path / "test.json"
+    save_json({1: "a"}, str(json_file))
+    assert load_json(str(json_file)) == {"1": "a"}
+
+def test_json_stdlib_fallback(tmp_path):
+    """Test values only the stdlib json module can represent."""
+    json_file = tmp_path / "test.json"
+    
+    # NaN/Infinity round-trip instead of turning into null
+    save_json({"x": float("nan"), "y": float("inf")}, str(json_file))
+    data = load_json(str(json_file))
+    assert math.isnan(data["x"])
+    assert data["y"] == float("inf")
+    assert math.isnan(parse_json(to_json({"x": float("nan")}))["x"])
+    
+    # Integers beyond 64 bits
+    assert parse_json(to_json({"big": 2 ** 70})) == {"big": 2 ** 70}
@@ -0,0 +1,44 @@
+"""
+Tests for queue-based logging.
+"""
+
+import atexit
+import logging
+import logging.handlers
+from ..logging_utils import setup_logger, set_log_level, _stop_listener
+
+def test_setup_logger_queue(tmp_path, monkeypatch):
+    """Test that queued records reach the file handler."""
+    log_file = tmp_path / "test.log"
+    exit_hooks = []
+    monkeypatch.setattr(atexit, "register", lambda func, *args: exit_hooks.append(func))
+    
+    logger = setup_logger("test_queue", str(log_file))
+    assert any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers)
+    logger.info("first")
+    
+    # Setting the logger up again flushes the old queue, keeps one handler
+    # and does not register another exit hook
+    logger = setup_logger("test_queue", str(log_file))
+    assert len(logger.handlers) == 1
+    assert exit_hooks == [_stop_listener]
+    logger.info("second")
+    
+    # Stopping the listener flushes everything still queued
+    _stop_listener(logger)
+    lines = log_file.read_text().splitlines()
+    assert [line.rsplit(" - ", 1)[-1] for line in lines] == ["first", "second"]
+
+def test_set_log_level_keeps_queued_records(tmp_path):
+    """Test that raising the level does not drop records already queued."""
+    log_file = tmp_path / "test.log"
+    
+    logger = setup_logger("test_queue_level", str(log_file))
+    logger.info("queued")
+    set_log_level(logger, logging.WARNING)
+    logger.info("filtered")
+    logger.warning("kept")
+    
+    _stop_listener(logger)
+    lines = log_file.read_text().splitlines()
+    assert [line.rsplit(" - ", 1)[-1] for line in lines] == ["queued", "kept"]
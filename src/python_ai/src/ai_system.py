@@ -4,6 +4,7 @@ AI system implementation.
 
 import os
 import json
+import asyncio
 import time
 import random
 import logging
@@ -13,7 +14,11 @@ import torch.nn as nn
 import torch.optim as optim
 import torch.cuda
 import torch.utils.data
-from typing import List, Dict, Any, Optional, Tuple
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from .models import (
     GameState,
     Action,
@@ -31,9 +36,81 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _read_bytes(path: str) -> bytes:
+    """Read the whole file with a single unbuffered read."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size) if size else b""
+        if size and len(data) == size:
+            return data
+        # Short read, or a file that reports no size (pipes, procfs):
+        # keep reading until EOF
+        chunks = [data]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+def _write_bytes(path: str, data: bytes):
+    """Write the whole buffer to a file through a raw file descriptor."""
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _ndarray_to_list(value: Any) -> Any:
+    """json.dumps default hook for numpy arrays."""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON with orjson, falling back to stdlib json for NaN/Infinity literals."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def _to_int8(values: np.ndarray, name: str) -> np.ndarray:
+    """Cast an array to int8, rejecting values the cast would change."""
+    with np.errstate(invalid="ignore"):
+        packed = values.astype(np.int8)
+    if not np.array_equal(packed, values):
+        raise ValueError(f"{name} must be integers in the int8 range")
+    return packed
+
+async def _run_in_threads(calls: Iterable[Tuple[Any, ...]]):
+    """Run (func, *args) calls concurrently in worker threads.
+
+    TaskGroup reports failures as an ExceptionGroup; the first one is
+    re-raised as is so callers see the same exceptions as the sync API.
+    """
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for func, *args in calls:
+                tg.create_task(asyncio.to_thread(func, *args))
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+
 class AISystem:
     """Main AI system class that manages AI players and training."""
     
+    # Player type name -> player class; also used to infer the type from a model file name
+    _PLAYER_TYPES: Dict[str, type] = {
+        "heuristic": HeuristicAIPlayer,
+        "neural_net": NeuralNetAIPlayer,
+        "rl": ReinforcementLearningAIPlayer,
+    }
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize the AI system."""
         self.players: Dict[str, AIPlayer] = {}
@@ -55,8 +132,7 @@ class AISystem:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return json.loads(_read_bytes(config_path))
         except (json.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Failed to load config: {e}")
             raise
@@ -81,14 +157,10 @@ class AISystem:
             if not isinstance(difficulty, int) or difficulty < 1:
                 raise ValueError(f"Invalid difficulty level: {difficulty}")
                 
-            if player_type == "heuristic":
-                player = HeuristicAIPlayer(difficulty, name)
-            elif player_type == "neural_net":
-                player = NeuralNetAIPlayer(difficulty, name)
-            elif player_type == "rl":
-                player = ReinforcementLearningAIPlayer(difficulty, name)
-            else:
+            player_cls = self._PLAYER_TYPES.get(player_type)
+            if player_cls is None:
                 raise ValueError(f"Unknown player type: {player_type}")
+            player = player_cls(difficulty, name)
             
             self.players[player.name] = player
             logger.info(f"Created {player_type} player: {player.name}")
@@ -160,8 +232,12 @@ class AISystem:
             logger.error(f"Failed to save player: {e}")
             raise
 
-    def load_player(self, player_name: str, path: Optional[str] = None):
-        """Load a player's state."""
+    def load_player(self, player_name: str, path: Optional[str] = None, for_inference: bool = False):
+        """Load a player's state.
+
+        With ``for_inference`` the loaded model is quantized to int8 for
+        serving and can no longer be trained.
+        """
         if path is None:
             path = os.path.join(MODEL_SAVE_PATH, f"{player_name}.pt")
         
@@ -170,30 +246,61 @@ class AISystem:
         
         try:
             # Determine player type from file name
-            if "heuristic" in path:
-                player = HeuristicAIPlayer(1, player_name)
-            elif "neural_net" in path:
-                player = NeuralNetAIPlayer(1, player_name)
-            elif "rl" in path:
-                player = ReinforcementLearningAIPlayer(1, player_name)
-            else:
+            player_cls = next(
+                (cls for player_type, cls in self._PLAYER_TYPES.items() if player_type in path),
+                None
+            )
+            if player_cls is None:
                 raise ValueError(f"Could not determine player type from path: {path}")
+            player = player_cls(1, player_name)
             
             player.load(path)
+            if for_inference:
+                player.freeze_for_inference()
             self.players[player_name] = player
             logger.info(f"Loaded player {player_name} from {path}")
         except Exception as e:
             logger.error(f"Failed to load player: {e}")
             raise
 
+    async def save_all_players(self, directory: Optional[str] = None):
+        """Save every player's state concurrently.
+
+        Each save runs in a worker thread, so model serialization and file
+        writes of different players overlap instead of running back to back.
+        Like save_player, a failure raises the original exception.
+        """
+        if directory is None:
+            directory = MODEL_SAVE_PATH
+        
+        await _run_in_threads(
+            (self.save_player, player_name, os.path.join(directory, f"{player_name}.pt"))
+            for player_name in list(self.players)
+        )
+
+    async def load_all_players(self, paths: Dict[str, str]):
+        """Load players concurrently from a {player_name: model_path} mapping.
+
+        Like load_player, a failure raises the original exception.
+        """
+        await _run_in_threads(
+            (self.load_player, player_name, path) for player_name, path in paths.items()
+        )
+
     def save_training_data(self, path: Optional[str] = None):
         """Save training data to file."""
         if path is None:
             path = os.path.join(TRAINING_DATA_PATH, f"training_data_{int(time.time())}.json")
         
         try:
-            with open(path, 'w') as f:
-                json.dump(self.training_data, f)
+            # orjson writes NaN/Infinity as null, so non-finite rewards go
+            # through the stdlib json module, which keeps them
+            if orjson is not None and all(np.isfinite(d[2]) for d in self.training_data):
+                # Boards are numpy arrays; orjson serializes them natively
+                payload = orjson.dumps(self.training_data, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(self.training_data, default=_ndarray_to_list).encode('utf-8')
+            _write_bytes(path, payload)
             logger.info(f"Saved training data to {path}")
         except Exception as e:
             logger.error(f"Failed to save training data: {e}")
@@ -202,8 +309,44 @@ class AISystem:
     def load_training_data(self, path: str):
         """Load training data from file."""
         try:
-            with open(path, 'r') as f:
-                self.training_data = json.load(f)
+            self.training_data = _loads_json(_read_bytes(path))
+            logger.info(f"Loaded training data from {path}")
+        except Exception as e:
+            logger.error(f"Failed to load training data: {e}")
+            raise
+
+    def save_training_data_npz(self, path: Optional[str] = None):
+        """Save training data as compressed numpy arrays.
+
+        States, actions and rewards are stored as raw binary arrays instead of
+        decimal JSON text, which is much smaller and faster to load. States
+        and actions are stored as int8; values that do not fit raise
+        ValueError instead of being truncated.
+        """
+        if path is None:
+            path = os.path.join(TRAINING_DATA_PATH, f"training_data_{int(time.time())}.npz")
+        
+        try:
+            count = len(self.training_data)
+            states = np.asarray(
+                [d[0].board if isinstance(d[0], GameState) else d[0] for d in self.training_data]
+            ).reshape(count, INPUT_SIZE)
+            states = _to_int8(states, "states")
+            actions = _to_int8(np.asarray([d[1] for d in self.training_data]).reshape(count), "actions")
+            rewards = np.fromiter((d[2] for d in self.training_data), dtype=np.float32, count=count)
+            # Write through a file object so numpy does not append ".npz" to the path
+            with open(path, 'wb') as f:
+                np.savez_compressed(f, states=states, actions=actions, rewards=rewards)
+            logger.info(f"Saved training data to {path}")
+        except Exception as e:
+            logger.error(f"Failed to save training data: {e}")
+            raise
+
+    def load_training_data_npz(self, path: str):
+        """Load training data saved by save_training_data_npz."""
+        try:
+            with np.load(path) as data:
+                self.training_data = list(zip(data['states'], data['actions'], data['rewards']))
             logger.info(f"Loaded training data from {path}")
         except Exception as e:
             logger.error(f"Failed to load training data: {e}")
@@ -222,14 +365,34 @@ class AISystem:
             raise ValueError("No training data available")
         
         try:
-            # Convert training data to tensors and move to device
-            states = torch.FloatTensor([d[0] for d in self.training_data]).to(self.device)
-            actions = torch.LongTensor([d[1] for d in self.training_data]).to(self.device)
-            rewards = torch.FloatTensor([d[2] for d in self.training_data]).to(self.device)
+            # Convert training data to contiguous numpy buffers in one pass each,
+            # then hand them to torch without per-element conversion
+            count = len(self.training_data)
+            states_np = np.asarray(
+                [d[0].board_flat if isinstance(d[0], GameState) else d[0] for d in self.training_data],
+                dtype=np.float32
+            ).reshape(count, -1)
+            actions_np = np.fromiter((d[1] for d in self.training_data), dtype=np.int64, count=count)
+            rewards_np = np.fromiter((d[2] for d in self.training_data), dtype=np.float32, count=count)
+            # Tensors stay on the host so the loader can pin and prefetch them
+            states = torch.from_numpy(states_np)
+            actions = torch.from_numpy(actions_np)
+            rewards = torch.from_numpy(rewards_np)
             
             # Create data loader
             dataset = torch.utils.data.TensorDataset(states, actions, rewards)
-            dataloader = torch.utils.data.DataLoader(dataset, batch_size=batch_size, shuffle=True)
+            # Worker processes and pinned memory only pay off when batches are
+            # copied to a GPU; on CPU they are pure startup overhead
+            use_cuda = self.device.type == "cuda"
+            num_workers = min(4, os.cpu_count() or 1) if use_cuda else 0
+            dataloader = torch.utils.data.DataLoader(
+                dataset,
+                batch_size=batch_size,
+                shuffle=True,
+                num_workers=num_workers,
+                pin_memory=use_cuda,
+                persistent_workers=num_workers > 0
+            )
             
             # Move model to device
             player.model = player.model.to(self.device)
@@ -242,9 +405,14 @@ class AISystem:
             for epoch in range(epochs):
                 total_loss = 0
                 for batch_states, batch_actions, batch_rewards in dataloader:
+                    batch_states = batch_states.to(self.device, non_blocking=use_cuda)
+                    batch_actions = batch_actions.to(self.device, non_blocking=use_cuda)
+                    batch_rewards = batch_rewards.to(self.device, non_blocking=use_cuda)
                     optimizer.zero_grad()
-                    predictions = player.model(batch_states)
-                    loss = criterion(predictions, batch_rewards)
+                    # bfloat16 keeps the fp32 exponent range, so no loss scaling is needed
+                    with torch.autocast(device_type=self.device.type, dtype=torch.bfloat16, enabled=use_cuda):
+                        predictions = player.model(batch_states)
+                    loss = criterion(predictions.float(), batch_rewards)
                     loss.backward()
                     optimizer.step()
                     total_loss += loss.item()
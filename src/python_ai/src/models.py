@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Union
 import numpy as np
 import torch
 import torch.nn as nn
+from .constants import INPUT_SIZE, MEMORY_CAPACITY
 
 # Настройка логирования
 logging.basicConfig(
@@ -16,6 +17,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _compile_model(model: nn.Module) -> nn.Module:
+    """Fuse the model into compiled kernels when running on CUDA.
+
+    CPU-only hosts keep the eager model, since TorchInductor needs a working
+    C++ toolchain there and the small MLP gains little from it.
+    """
+    if torch.cuda.is_available() and hasattr(torch, "compile"):
+        return torch.compile(model, mode="reduce-overhead", fullgraph=True)
+    return model
+
 @dataclass
 class GameState:
     """Represents the current state of the game for AI decision making."""
@@ -33,6 +44,10 @@ class GameState:
         """Validate the game state after initialization."""
         if not isinstance(self.board, np.ndarray):
             raise TypeError("board must be a numpy array")
+        if not np.issubdtype(self.board.dtype, np.integer):
+            raise TypeError("board must contain integers")
+        if self.board.size and (self.board.min() < np.iinfo(np.int8).min or self.board.max() > np.iinfo(np.int8).max):
+            raise ValueError("board values must fit in int8")
         if not isinstance(self.current_block, dict):
             raise TypeError("current_block must be a dictionary")
         if not isinstance(self.next_blocks, list):
@@ -50,6 +65,14 @@ class GameState:
         if not isinstance(self.difficulty_level, int):
             raise TypeError("difficulty_level must be an integer")
 
+        # Block IDs fit in int8; keep one compact contiguous layout
+        self.board = np.ascontiguousarray(self.board, dtype=np.int8)
+
+    @property
+    def board_flat(self) -> np.ndarray:
+        """Flattened float32 copy of the current board, ready for torch.from_numpy."""
+        return self.board.reshape(-1).astype(np.float32)
+
 @dataclass
 class Action:
     """Represents an action that the AI can take."""
@@ -63,6 +86,84 @@ class Action:
         if not isinstance(self.parameters, dict):
             raise TypeError("parameters must be a dictionary")
 
+class ReplayMemory:
+    """Fixed-capacity replay buffer stored as preallocated numpy arrays.
+
+    Transitions are written column-wise into a ring buffer, so pushing never
+    allocates and sampling is a single fancy-index gather per field.
+    """
+    def __init__(self, capacity: int = MEMORY_CAPACITY, state_size: int = INPUT_SIZE):
+        """Initialize the replay memory.
+        
+        Args:
+            capacity (int): Maximum number of stored transitions
+            state_size (int): Number of values in a flattened state
+        """
+        self.capacity = capacity
+        self.states = np.empty((capacity, state_size), dtype=np.float32)
+        self.actions = np.empty(capacity, dtype=np.int64)
+        self.rewards = np.empty(capacity, dtype=np.float32)
+        self.next_states = np.empty((capacity, state_size), dtype=np.float32)
+        self.position = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray):
+        """Store a transition, overwriting the oldest one when full.
+        
+        Args:
+            state (np.ndarray): State before the action
+            action (int): Action taken
+            reward (float): Reward received
+            next_state (np.ndarray): State after the action
+        """
+        i = self.position
+        self.states[i] = np.ravel(state)
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = np.ravel(next_state)
+        self.position = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def sample(self, batch_size: int) -> tuple:
+        """Sample a random batch of transitions.
+        
+        Args:
+            batch_size (int): Number of transitions to sample
+            
+        Returns:
+            tuple: (states, actions, rewards, next_states) tensors
+            
+        Raises:
+            ValueError: If the memory is empty
+        """
+        if self.size == 0:
+            raise ValueError("Cannot sample from empty replay memory")
+        idx = np.random.randint(0, self.size, batch_size)
+        return (
+            torch.from_numpy(self.states[idx]),
+            torch.from_numpy(self.actions[idx]),
+            torch.from_numpy(self.rewards[idx]),
+            torch.from_numpy(self.next_states[idx])
+        )
+
+class _ReplayMemoryMixin:
+    """Transition storage shared by the players that own a ReplayMemory."""
+    memory: ReplayMemory
+
+    def _add_to_memory(self, state: np.ndarray, action: int, reward: float, next_state: np.ndarray):
+        """Store a transition in the replay memory.
+        
+        Args:
+            state (np.ndarray): State before the action
+            action (int): Action taken
+            reward (float): Reward received
+            next_state (np.ndarray): State after the action
+        """
+        self.memory.push(state, action, reward, next_state)
+
 class AIPlayer:
     """Abstract base class for all AI player implementations."""
     def __init__(self, difficulty: int, name: str = "AI"):
@@ -131,6 +232,22 @@ class AIPlayer:
         """
         raise NotImplementedError
 
+    def freeze_for_inference(self):
+        """Switch the player's model to an int8 inference-only model.
+        
+        Linear layers are dynamically quantized to int8, which cuts weight
+        memory roughly by four and speeds up CPU inference. The player can
+        no longer be trained afterwards. Players without a model are left
+        unchanged.
+        """
+        model = getattr(self, "model", None)
+        if model is None:
+            return
+        # Quantization works on the eager module, not the compiled wrapper
+        model = getattr(model, "_orig_mod", model).to("cpu").eval()
+        self.model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+        logger.info(f"Quantized model of player {self.name} for inference")
+
 @dataclass
 class HeuristicAIPlayer(AIPlayer):
     """AI player that uses heuristic-based decision making."""
@@ -194,11 +311,11 @@ class HeuristicAIPlayer(AIPlayer):
         return weights.get(difficulty, weights[4])
 
 @dataclass
-class NeuralNetAIPlayer(AIPlayer):
+class NeuralNetAIPlayer(_ReplayMemoryMixin, AIPlayer):
     """AI player that uses neural networks for decision making."""
     model: nn.Module
     epsilon: float
-    memory: List[tuple]
+    memory: ReplayMemory
     last_state: Optional[GameState] = None
     last_action: Optional[Action] = None
     last_reward: float = 0.0
@@ -214,7 +331,7 @@ class NeuralNetAIPlayer(AIPlayer):
         try:
             self.model = self._create_model()
             self.epsilon = self._get_epsilon_for_difficulty(difficulty)
-            self.memory = []
+            self.memory = ReplayMemory()
             logger.info(f"Initialized neural network with epsilon {self.epsilon}")
         except Exception as e:
             logger.error(f"Failed to initialize neural network: {e}")
@@ -249,7 +366,7 @@ class NeuralNetAIPlayer(AIPlayer):
                 def forward(self, x):
                     return self.layers(x)
 
-            return TetrisNet()
+            return _compile_model(TetrisNet())
         except Exception as e:
             logger.error(f"Failed to create neural network: {e}")
             raise RuntimeError(f"Model creation failed: {e}")
@@ -272,13 +389,13 @@ class NeuralNetAIPlayer(AIPlayer):
         return epsilons.get(difficulty, epsilons[4])
 
 @dataclass
-class ReinforcementLearningAIPlayer(AIPlayer):
+class ReinforcementLearningAIPlayer(_ReplayMemoryMixin, AIPlayer):
     """AI player that uses reinforcement learning for decision making."""
     model: nn.Module
     target_model: nn.Module
     epsilon: float
     epsilon_decay: float
-    memory: List[tuple]
+    memory: ReplayMemory
     last_state: Optional[GameState] = None
     last_action: Optional[Action] = None
     last_reward: float = 0.0
@@ -297,7 +414,7 @@ class ReinforcementLearningAIPlayer(AIPlayer):
             self.target_model = self._create_model()
             self.epsilon = 1.0
             self.epsilon_decay = 0.995
-            self.memory = []
+            self.memory = ReplayMemory()
             self.steps = 0
             logger.info(f"Initialized RL player with epsilon {self.epsilon}")
         except Exception as e:
@@ -332,7 +449,7 @@ class ReinforcementLearningAIPlayer(AIPlayer):
                 def forward(self, x):
                     return self.layers(x)
 
-            return TetrisNet()
+            return _compile_model(TetrisNet())
         except Exception as e:
             logger.error(f"Failed to create neural network: {e}")
             raise RuntimeError(f"Model creation failed: {e}") 
\ No newline at end of file
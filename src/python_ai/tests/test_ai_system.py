@@ -199,4 +199,94 @@ def test_evaluate_player(ai_system, game_state):
     
     # Test evaluation with non-existent player
     with pytest.raises(ValueError):
-        ai_system.evaluate_player("non_existent", test_data) 
\ No newline at end of file
+        ai_system.evaluate_player("non_existent", test_data)
+
+
+def test_save_load_training_data_npz(ai_system, tmp_path):
+    """Test saving and loading training data as numpy arrays."""
+    ai_system.training_data = [
+        (np.random.randint(0, 8, (20, 10)), np.random.randint(1, 8), float(np.random.rand()))
+        for _ in range(10)
+    ]
+    expected = ai_system.training_data
+    
+    path = str(tmp_path / "training_data.npz")
+    ai_system.save_training_data_npz(path)
+    ai_system.load_training_data_npz(path)
+    
+    assert len(ai_system.training_data) == len(expected)
+    for (state, action, reward), (exp_state, exp_action, exp_reward) in zip(ai_system.training_data, expected):
+        assert np.array_equal(state, exp_state.reshape(-1))
+        assert action == exp_action
+        assert reward == pytest.approx(exp_reward)
+
+
+def test_save_training_data_npz_validation(ai_system, game_state, tmp_path):
+    """Test saving empty, GameState and lossy training data as numpy arrays."""
+    path = str(tmp_path / "training_data.npz")
+    
+    ai_system.training_data = []
+    ai_system.save_training_data_npz(path)
+    ai_system.load_training_data_npz(path)
+    assert ai_system.training_data == []
+    
+    ai_system.training_data = [(game_state, 1, 0.5)]
+    ai_system.save_training_data_npz(path)
+    ai_system.load_training_data_npz(path)
+    assert np.array_equal(ai_system.training_data[0][0], game_state.board.reshape(-1))
+    
+    # Paths without the .npz suffix are used as given
+    other_path = str(tmp_path / "training_data.bin")
+    ai_system.save_training_data_npz(other_path)
+    ai_system.load_training_data_npz(other_path)
+    assert len(ai_system.training_data) == 1
+    
+    ai_system.training_data = [(np.full(INPUT_SIZE, 0.7), 1, 0.5)]
+    with pytest.raises(ValueError):
+        ai_system.save_training_data_npz(path)
+    
+    ai_system.training_data = [(np.full(INPUT_SIZE, 200), 1, 0.5)]
+    with pytest.raises(ValueError):
+        ai_system.save_training_data_npz(path)
+
+
+@pytest.mark.asyncio
+async def test_save_load_all_players(ai_system, tmp_path, monkeypatch):
+    """Test saving and loading several players concurrently."""
+    def save(self, path):
+        with open(path, "w") as f:
+            f.write(self.name)
+    
+    def load(self, path):
+        with open(path) as f:
+            assert f.read() == self.name
+    
+    monkeypatch.setattr(HeuristicAIPlayer, "save", save)
+    monkeypatch.setattr(HeuristicAIPlayer, "load", load)
+    ai_system.create_player("heuristic", DIFFICULTY_EASY, "heuristic_1")
+    ai_system.create_player("heuristic", DIFFICULTY_EASY, "heuristic_2")
+    
+    await ai_system.save_all_players(str(tmp_path))
+    ai_system.players.clear()
+    await ai_system.load_all_players({
+        name: str(tmp_path / f"{name}.pt") for name in ("heuristic_1", "heuristic_2")
+    })
+    assert set(ai_system.players) == {"heuristic_1", "heuristic_2"}
+    
+    # Errors are raised as is, not wrapped in an ExceptionGroup
+    with pytest.raises(FileNotFoundError):
+        await ai_system.load_all_players({"missing": str(tmp_path / "heuristic_missing.pt")})
+
+
+def test_save_load_training_data_nan(ai_system, tmp_path):
+    """Test that non-finite rewards survive a JSON round-trip."""
+    ai_system.training_data = [(np.zeros(INPUT_SIZE, dtype=np.int8), 1, float("nan"))]
+    
+    path = str(tmp_path / "training_data.json")
+    ai_system.save_training_data(path)
+    ai_system.load_training_data(path)
+    
+    state, action, reward = ai_system.training_data[0]
+    assert state == [0] * INPUT_SIZE
+    assert action == 1
+    assert np.isnan(reward)
@@ -8,6 +8,7 @@ import torch
 from ..src.models import (
     GameState,
     Action,
+    ReplayMemory,
     HeuristicAIPlayer,
     NeuralNetAIPlayer,
     ReinforcementLearningAIPlayer
@@ -33,6 +34,9 @@ def test_game_state(game_state):
     """Test GameState class."""
     assert isinstance(game_state.board, np.ndarray)
     assert game_state.board.shape == (20, 10)
+    assert game_state.board.dtype == np.int8
+    assert game_state.board_flat.shape == (200,)
+    assert game_state.board_flat.dtype == np.float32
     assert isinstance(game_state.current_block, dict)
     assert isinstance(game_state.next_blocks, list)
     assert isinstance(game_state.player_stats, dict)
@@ -41,6 +45,16 @@ def test_game_state(game_state):
     assert isinstance(game_state.active_spells, list)
     assert isinstance(game_state.game_mode, str)
     assert isinstance(game_state.difficulty_level, int)
+    
+    # board_flat follows changes to the board
+    game_state.board[0, 0] = 3
+    assert game_state.board_flat[0] == 3
+    
+    # Boards that do not fit int8 are rejected instead of truncated
+    with pytest.raises(ValueError):
+        GameState(**{**vars(game_state), "board": np.full((20, 10), 200)})
+    with pytest.raises(TypeError):
+        GameState(**{**vars(game_state), "board": np.full((20, 10), 0.5)})
 
 def test_action():
     """Test Action class."""
@@ -156,4 +170,36 @@ def test_rl_player(game_state):
     # Test epsilon decay
     initial_epsilon = player.epsilon
     player._update_epsilon()
-    assert player.epsilon < initial_epsilon 
\ No newline at end of file
+    assert player.epsilon < initial_epsilon
+
+
+def test_freeze_for_inference(game_state):
+    """Test quantizing a player's model for inference."""
+    player = NeuralNetAIPlayer(DIFFICULTY_MEDIUM, "test")
+    player.freeze_for_inference()
+    assert not player.model.training
+    
+    output = player.model(torch.zeros(1, INPUT_SIZE))
+    assert output.shape == (1, OUTPUT_SIZE)
+    
+    # Heuristic players have no model and are left untouched
+    heuristic_player = HeuristicAIPlayer(DIFFICULTY_EASY, "test")
+    heuristic_player.freeze_for_inference()
+    assert not hasattr(heuristic_player, "model")
+
+def test_replay_memory():
+    """Test ReplayMemory ring buffer."""
+    memory = ReplayMemory(capacity=4, state_size=INPUT_SIZE)
+    assert len(memory) == 0
+    
+    for i in range(6):
+        memory.push(np.full((20, 10), i), i, float(i), np.full((20, 10), i + 1))
+    assert len(memory) == 4
+    # The two oldest transitions were overwritten
+    assert sorted(memory.actions.tolist()) == [2, 3, 4, 5]
+    
+    states, actions, rewards, next_states = memory.sample(8)
+    assert states.shape == (8, INPUT_SIZE)
+    assert actions.dtype == torch.int64
+    assert rewards.shape == (8,)
+    assert torch.equal(next_states[:, 0], states[:, 0] + 1)
@@ -1,11 +1,10 @@
 """Game server package."""
 
 import os
-import sys
 
-# Include internal ``src`` directory in module search path so tests and
-# external code can import submodules as ``python_server.<module>``.
-_CURRENT_DIR = os.path.dirname(__file__)
-_SRC_PATH = os.path.join(_CURRENT_DIR, "src")
-if _SRC_PATH not in sys.path:
-    sys.path.insert(0, _SRC_PATH)
+# Expose the internal ``src`` directory as part of this package so tests and
+# external code can import submodules as ``python_server.<module>`` without
+# adding entries to the global ``sys.path``.
+_SRC_PATH = os.path.join(os.path.dirname(__file__), "src")
+if _SRC_PATH not in __path__:
+    __path__.append(_SRC_PATH)
@@ -1,14 +1,49 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
-import json
+import orjson
 import requests
 import time
-import websocket
-import threading
-import queue
+import asyncio
+import websockets
 import random
+from contextlib import ExitStack
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+# Общая HTTP-сессия: keep-alive соединения переиспользуются всеми тестами
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=32, max_retries=0))
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# Неизменяемые тела запросов сериализуются один раз при загрузке модуля
+JSON_HEADERS = {"Content-Type": "application/json"}
+SIMULATE_BODY = orjson.dumps({
+    "dt": 0.016,
+    "entities": [{"id": 1, "type": "block", "x": 5, "y": 0, "rotation": 0}]
+})
+CREATE_RACE_EASY = orjson.dumps({"mode": "RACE", "players": 1, "difficulty": "EASY"})
+CREATE_RACE_MEDIUM_AI = orjson.dumps({
+    "mode": "RACE", "players": 1, "ai_opponents": 1, "difficulty": "MEDIUM"
+})
+TEST_LEVEL_BODY = orjson.dumps({
+    "name": "Test Level",
+    "difficulty": "MEDIUM",
+    "blocks": [
+        {"type": "L", "initialX": 5, "initialY": 0},
+        {"type": "I", "initialX": 2, "initialY": 3}
+    ]
+})
+END_GAME_BODY = orjson.dumps({"playerId": "player1", "score": 5000})
+
+WS_URL = "ws://localhost:8081/ws"
+
+def _j(response):
+    # orjson разбирает байты ответа напрямую, минуя определение кодировки requests
+    return orjson.loads(response.content)
 
 # Функция для проверки интеграции между C++ и Python
 def test_cpp_python_integration():
@@ -17,7 +52,7 @@ def test_cpp_python_integration():
     try:
         # Проверка доступности физического движка
         try:
-            response = requests.get("http://localhost:9000/physics/status")
+            response = SESSION.get("http://localhost:9000/physics/status")
             if response.status_code != 200:
                 print("Error: Physics engine is not available")
                 return False
@@ -26,16 +61,17 @@ def test_cpp_python_integration():
             return False
 
         # Проверка API для физических операций
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:9000/physics/simulate",
-            json={"dt": 0.016, "entities": [{"id": 1, "type": "block", "x": 5, "y": 0, "rotation": 0}]}
+            data=SIMULATE_BODY,
+            headers=JSON_HEADERS
         )
         
         if response.status_code != 200:
             print(f"Error: Server returned status code {response.status_code}")
             return False
         
-        result = response.json()
+        result = _j(response)
         if "entities" not in result or not isinstance(result["entities"], list):
             print("Error: Invalid response format")
             return False
@@ -57,86 +93,66 @@ def test_cpp_python_integration():
 def test_python_typescript_integration():
     print("Testing Python Game Logic and TypeScript Client integration...")
     
-    message_queue = queue.Queue()
-    
-    def on_message(ws, message):
-        message_queue.put(json.loads(message))
-    
-    def on_error(ws, error):
-        print(f"WebSocket error: {error}")
-    
-    def on_close(ws, close_status_code, close_msg):
-        print("WebSocket connection closed")
-    
-    def on_open(ws):
-        print("WebSocket connection opened")
-        ws.send(json.dumps({
-            "type": "JOIN_GAME",
-            "gameId": game_id,
-            "playerId": "player1"
-        }))
-    
     try:
         # Создание новой игры
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8080/api/v1/games",
-            json={"mode": "RACE", "players": 1, "difficulty": "EASY"}
+            data=CREATE_RACE_EASY,
+            headers=JSON_HEADERS
         )
         
         if response.status_code != 200:
             print(f"Error: Server returned status code {response.status_code}")
             return False
         
-        game_data = response.json()
+        game_data = _j(response)
         if "gameId" not in game_data:
             print("Error: Invalid response format (missing gameId)")
             return False
         
         game_id = game_data["gameId"]
         
-        # Подключение к WebSocket
-        ws = websocket.WebSocketApp(
-            f"ws://localhost:8081/ws",
-            on_open=on_open,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close
-        )
-        
-        ws_thread = threading.Thread(target=ws.run_forever)
-        ws_thread.daemon = True
-        ws_thread.start()
+        if not asyncio.run(_python_typescript_ws_session(game_id)):
+            return False
         
-        # Ожидание подключения
-        time.sleep(2)
+        print("Python Game Logic and TypeScript Client integration test passed.")
+        return True
+    
+    except Exception as e:
+        print(f"Error during test: {e}")
+        return False
+
+async def _python_typescript_ws_session(game_id):
+    # Подключение к WebSocket
+    async with websockets.connect(WS_URL, open_timeout=5) as ws:
+        print("WebSocket connection opened")
+        await ws.send(orjson.dumps({
+            "type": "JOIN_GAME",
+            "gameId": game_id,
+            "playerId": "player1"
+        }).decode())
         
         # Выполнение действия в игре через WebSocket
-        ws.send(json.dumps({
+        await ws.send(orjson.dumps({
             "type": "PLAYER_ACTION",
             "gameId": game_id,
             "playerId": "player1",
             "actionType": "MOVE_RIGHT"
-        }))
+        }).decode())
         
         # Ожидание ответа
         try:
-            message = message_queue.get(timeout=5)
-            if message.get("type") != "GAME_STATE_UPDATE":
-                print(f"Error: Unexpected message type: {message.get('type')}")
-                return False
-        except queue.Empty:
+            message = orjson.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+        except asyncio.TimeoutError:
             print("Error: No response received from WebSocket")
             return False
         
-        # Закрытие WebSocket
-        ws.close()
-        
-        print("Python Game Logic and TypeScript Client integration test passed.")
-        return True
+        if message.get("type") != "GAME_STATE_UPDATE":
+            print(f"Error: Unexpected message type: {message.get('type')}")
+            return False
     
-    except Exception as e:
-        print(f"Error during test: {e}")
-        return False
+    print("WebSocket connection closed")
+    return True
 
 # Функция для проверки интеграции между Python Tools и Python Game Logic
 def test_python_tools_integration():
@@ -145,7 +161,7 @@ def test_python_tools_integration():
     try:
         # Проверка доступности Python Tools сервера
         try:
-            response = requests.get("http://localhost:8080/api/v1/dev/status")
+            response = SESSION.get("http://localhost:8080/api/v1/dev/status")
             if response.status_code != 200:
                 print("Error: Python Tools server is not available")
                 return False
@@ -153,30 +169,24 @@ def test_python_tools_integration():
             print("Error: Cannot connect to Python Tools server")
             return False
 
-        status = response.json()
+        status = _j(response)
         if "status" not in status or status["status"] != "ok":
             print("Error: Invalid status response")
             return False
         
         # Создание тестового уровня
         try:
-            response = requests.post(
+            response = SESSION.post(
                 "http://localhost:8080/api/v1/dev/levels",
-                json={
-                    "name": "Test Level",
-                    "difficulty": "MEDIUM",
-                    "blocks": [
-                        {"type": "L", "initialX": 5, "initialY": 0},
-                        {"type": "I", "initialX": 2, "initialY": 3}
-                    ]
-                }
+                data=TEST_LEVEL_BODY,
+                headers=JSON_HEADERS
             )
             
             if response.status_code != 200:
                 print(f"Error: Failed to create test level: {response.status_code}")
                 return False
                 
-            level_data = response.json()
+            level_data = _j(response)
             if "levelId" not in level_data:
                 print("Error: Invalid level creation response")
                 return False
@@ -184,12 +194,12 @@ def test_python_tools_integration():
             level_id = level_data["levelId"]
             
             # Проверка созданного уровня
-            response = requests.get(f"http://localhost:8080/api/v1/dev/levels/{level_id}")
+            response = SESSION.get(f"http://localhost:8080/api/v1/dev/levels/{level_id}")
             if response.status_code != 200:
                 print("Error: Failed to retrieve created level")
                 return False
                 
-            level = response.json()
+            level = _j(response)
             if "name" not in level or level["name"] != "Test Level":
                 print("Error: Invalid level data")
                 return False
@@ -209,26 +219,6 @@ def test_python_tools_integration():
 def test_full_system():
     print("Running full system test...")
     
-    message_queue = queue.Queue()
-    
-    def on_message(ws, message):
-        message_queue.put(json.loads(message))
-    
-    def on_error(ws, error):
-        print(f"WebSocket error: {error}")
-        message_queue.put({"type": "ERROR", "error": str(error)})
-    
-    def on_close(ws, close_status_code, close_msg):
-        print("WebSocket connection closed")
-    
-    def on_open(ws):
-        print("WebSocket connection opened")
-        ws.send(json.dumps({
-            "type": "JOIN_GAME",
-            "gameId": game_id,
-            "playerId": "player1"
-        }))
-    
     try:
         # Проверка доступности всех сервисов
         services = [
@@ -237,9 +227,13 @@ def test_full_system():
             ("http://localhost:8080/api/v1/dev/status", "Python Tools")
         ]
         
-        for url, name in services:
+        # Проверки независимы, поэтому запросы отправляются параллельно
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            futures = [executor.submit(SESSION.get, url) for url, _ in services]
+        
+        for future, (url, name) in zip(futures, services):
             try:
-                response = requests.get(url)
+                response = future.result()
                 if response.status_code != 200:
                     print(f"Error: {name} is not available")
                     return False
@@ -248,133 +242,194 @@ def test_full_system():
                 return False
 
         # 1. Проверка доступности сервера
-        response = requests.get("http://localhost:8080/api/v1/status")
+        response = SESSION.get("http://localhost:8080/api/v1/status")
         
         if response.status_code != 200:
             print(f"Error: Server returned status code {response.status_code}")
             return False
         
         # 2. Создание новой игры
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8080/api/v1/games",
-            json={"mode": "RACE", "players": 1, "ai_opponents": 1, "difficulty": "MEDIUM"}
+            data=CREATE_RACE_MEDIUM_AI,
+            headers=JSON_HEADERS
         )
         
         if response.status_code != 200:
             print(f"Error: Server returned status code {response.status_code}")
             return False
         
-        game_data = response.json()
+        game_data = _j(response)
         game_id = game_data["gameId"]
         
-        # 3. Подключение к WebSocket
-        ws = websocket.WebSocketApp(
-            f"ws://localhost:8081/ws",
-            on_open=on_open,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close
+        # 3-5. Игровой процесс через WebSocket
+        asyncio.run(_full_system_ws_session(game_id))
+        
+        # 6. Завершение игры
+        response = SESSION.post(
+            f"http://localhost:8080/api/v1/games/{game_id}/end",
+            data=END_GAME_BODY,
+            headers=JSON_HEADERS
         )
         
-        ws_thread = threading.Thread(target=ws.run_forever)
-        ws_thread.daemon = True
-        ws_thread.start()
+        if response.status_code != 200:
+            print(f"Error: Server returned status code {response.status_code}")
+            return False
+        
+        # 7. Получение аналитических данных
+        # Опрос до появления завершённой игры, не дольше 2 секунд
+        for _ in range(10):
+            response = SESSION.get("http://localhost:8080/api/v1/analytics/games")
+            if response.status_code == 200 and _game_in_analytics(_j(response), game_id):
+                break
+            time.sleep(0.2)
+        
+        if response.status_code != 200:
+            print(f"Error: Server returned status code {response.status_code}")
+            return False
+        
+        analytics = _j(response)
+        if "games" not in analytics:
+            print("Error: Invalid analytics response")
+            return False
         
-        # Ожидание подключения
-        time.sleep(2)
+        print("Full system test passed successfully.")
+        return True
+    
+    except Exception as e:
+        print(f"Error during full system test: {e}")
+        return False
+
+def _game_in_analytics(analytics, game_id):
+    games = analytics.get("games") or []
+    return any(isinstance(game, dict) and game.get("gameId") == game_id for game in games)
+
+async def _full_system_ws_session(game_id):
+    # 3. Подключение к WebSocket
+    async with websockets.connect(WS_URL, open_timeout=5) as ws:
+        print("WebSocket connection opened")
+        await ws.send(orjson.dumps({
+            "type": "JOIN_GAME",
+            "gameId": game_id,
+            "playerId": "player1"
+        }).decode())
         
         # 4. Симуляция игрового процесса
         actions = ["MOVE_LEFT", "MOVE_RIGHT", "ROTATE_CW", "ROTATE_CCW", "HARD_DROP"]
         
-        for i in range(20):
-            # Выбор случайного действия
-            action = random.choice(actions)
-            
-            # Отправка действия через WebSocket
-            ws.send(json.dumps({
+        # Сообщения для каждого действия сериализуются один раз для этой игры
+        templates = {
+            action: orjson.dumps({
                 "type": "PLAYER_ACTION",
                 "gameId": game_id,
                 "playerId": "player1",
                 "actionType": action
-            }))
-            
-            # Ожидание обновления состояния
+            }).decode()
+            for action in actions
+        }
+        
+        # Все действия отправляются подряд, ответы читаются после отправки
+        # Случайные действия выбираются одним вызовом
+        for action in random.choices(actions, k=20):
+            # Отправка действия через WebSocket
+            await ws.send(templates[action])
+        
+        # Ожидание обновлений состояния
+        for i in range(20):
             try:
-                message = message_queue.get(timeout=2)
+                message = orjson.loads(await asyncio.wait_for(ws.recv(), timeout=2))
                 if message.get("type") != "GAME_STATE_UPDATE":
                     print(f"Warning: Unexpected message type: {message.get('type')}")
-            except queue.Empty:
-                print("Warning: No response received from WebSocket")
-            
-            # Небольшая пауза между действиями
-            time.sleep(0.5)
+            except asyncio.TimeoutError:
+                print(f"Warning: Received only {i} of 20 responses from WebSocket")
+                break
         
         # 5. Использование заклинания
-        ws.send(json.dumps({
+        await ws.send(orjson.dumps({
             "type": "PLAYER_ACTION",
             "gameId": game_id,
             "playerId": "player1",
             "actionType": "CAST_SPELL",
             "spellType": "FREEZE"
-        }))
+        }).decode())
         
         # Ожидание обновления состояния
         try:
-            message = message_queue.get(timeout=2)
-        except queue.Empty:
+            await asyncio.wait_for(ws.recv(), timeout=2)
+        except asyncio.TimeoutError:
             print("Warning: No response received after spell cast")
-        
-        # 6. Завершение игры
-        response = requests.post(
-            f"http://localhost:8080/api/v1/games/{game_id}/end",
-            json={"playerId": "player1", "score": 5000}
-        )
-        
-        if response.status_code != 200:
-            print(f"Error: Server returned status code {response.status_code}")
-            return False
-        
-        # 7. Получение аналитических данных
-        time.sleep(2)  # Ожидание обработки данных
-        
-        response = requests.get("http://localhost:8080/api/v1/analytics/games")
-        
-        if response.status_code != 200:
-            print(f"Error: Server returned status code {response.status_code}")
-            return False
-        
-        analytics = response.json()
-        if "games" not in analytics:
-            print("Error: Invalid analytics response")
-            return False
-        
-        # 8. Закрытие WebSocket
-        ws.close()
-        
-        print("Full system test passed successfully.")
-        return True
     
-    except Exception as e:
-        print(f"Error during full system test: {e}")
+    print("WebSocket connection closed")
+
+# Заглушки сервисов для проверки самого тестового скрипта (--mock)
+class _MockWebSocket:
+    """Отвечает GAME_STATE_UPDATE на каждое PLAYER_ACTION."""
+    
+    def __init__(self, *args, **kwargs):
+        self._replies = asyncio.Queue()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
         return False
+    
+    async def send(self, message):
+        if orjson.loads(message).get("type") == "PLAYER_ACTION":
+            self._replies.put_nowait(orjson.dumps({"type": "GAME_STATE_UPDATE"}).decode())
+    
+    async def recv(self):
+        return await self._replies.get()
+
+def _mock_services():
+    import responses
+    
+    services = responses.RequestsMock(assert_all_requests_are_fired=False)
+    services.get("http://localhost:9000/physics/status", json={"status": "ok"})
+    services.post("http://localhost:9000/physics/simulate", json={
+        "entities": [{"id": 1, "velocity": {"x": 0, "y": 0.16}, "position": {"x": 5, "y": 0}}]
+    })
+    services.get("http://localhost:8080/api/v1/status", json={"status": "ok"})
+    services.post("http://localhost:8080/api/v1/games", json={"gameId": "mock-game"})
+    services.post(re.compile(r"http://localhost:8080/api/v1/games/[^/]+/end"), json={"status": "ok"})
+    services.get("http://localhost:8080/api/v1/analytics/games", json={"games": [{"gameId": "mock-game"}]})
+    services.get("http://localhost:8080/api/v1/dev/status", json={"status": "ok"})
+    services.post("http://localhost:8080/api/v1/dev/levels", json={"levelId": "mock-level"})
+    services.get("http://localhost:8080/api/v1/dev/levels/mock-level", json={"name": "Test Level"})
+    return services
 
 # Основная функция
 def main():
+    with ExitStack() as stack:
+        if "--mock" in sys.argv[1:]:
+            print("Running against mocked services")
+            stack.enter_context(_mock_services())
+            stack.enter_context(mock.patch.object(websockets, "connect", _MockWebSocket))
+        return run_tests()
+
+def run_tests():
     print("Starting integration tests...")
     
-    # Запуск тестов интеграции
+    # Независимые тесты интеграции выполняются параллельно
     tests = [
         test_cpp_python_integration,
         test_python_typescript_integration,
-        test_python_tools_integration,
-        test_full_system
+        test_python_tools_integration
     ]
     
-    success = True
-    for test in tests:
-        if not test():
-            success = False
-            break
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        results = {futures[future]: future.result() for future in as_completed(futures)}
+    
+    # Полный системный тест запускается последним; сбой одного теста не отменяет остальные
+    results[test_full_system.__name__] = test_full_system()
+    
+    print("\nIntegration test summary:")
+    for test in tests + [test_full_system]:
+        status = "PASSED" if results[test.__name__] else "FAILED"
+        print(f"  {test.__name__:<40} {status}")
+    
+    success = all(results.values())
     
     if success:
         print("All integration tests passed successfully.")